@@ -16,18 +16,19 @@ pulso.register_domain(
 )
 
 # Get all registered domains
-domains = pulso.get_registered_domains()
-print(f"Registered domains: {list(domains.keys())}")
-for domain, policy in domains.items():
-    print(f"  {domain}: ttl={policy.ttl_seconds}s, driver={policy.driver}")
+domains = pulso.get_registered_domains_flat()
+print(f"Registered domains: {[domain for domain, *_ in domains]}")
+for domain, ttl, driver, *_ in domains:
+    print(f"  {domain}: ttl={ttl}s, driver={driver}")
 
 # Fetch content (uses cache if fresh)
 url = "https://example.com"
 html = pulso.fetch(url)
 print(f"Fetched {len(html)} bytes from {url}")
 
-# Check if content has changed
-if pulso.has_changed(url):
+# Check if content has changed and get metadata in one call
+result = pulso.peek(url)
+if result.changed:
     print("Content has changed!")
     # Create a snapshot of the new content
     snapshot_path = pulso.snapshot(url)
@@ -35,8 +36,8 @@ if pulso.has_changed(url):
 else:
     print("No changes detected")
 
-# Get metadata about the cached URL
-metadata = pulso.get_metadata(url)
+# Metadata about the cached URL
+metadata = result.metadata
 if metadata:
     print(f"\nMetadata:")
     print(f"  Content hash: {metadata['content_hash'][:16]}...")
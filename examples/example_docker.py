@@ -1,6 +1,7 @@
 """Example application for Docker deployment with Redis caching."""
 
 import pulso
+import asyncio
 import os
 import logging
 
@@ -13,6 +14,14 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+async def fetch_all(urls):
+    """Fetch all URLs concurrently, returning errors in place of results."""
+    return await asyncio.gather(
+        *(pulso.afetch(url) for url in urls),
+        return_exceptions=True
+    )
+
+
 def main():
     """Main application using Pulso in Docker environment."""
 
@@ -39,15 +48,17 @@ def main():
         "https://httpbin.org/user-agent",
     ]
 
-    # Fetch and process
-    for url in urls:
-        logger.info(f"Fetching: {url}")
+    # Fetch all URLs concurrently, then process the results
+    logger.info(f"Fetching {len(urls)} URLs")
+    results = asyncio.run(fetch_all(urls))
 
+    for url, html in zip(urls, results):
         try:
-            html = pulso.fetch(url)
+            if isinstance(html, BaseException):
+                raise html
 
             if html:
-                logger.info(f"Success: {url} - {len(html)} bytes")
+                logger.info(f"Success: {url} - {pulso.get_size(url)} bytes")
 
                 # Get metadata
                 metadata = pulso.get_metadata(url)
@@ -76,11 +87,10 @@ def main():
 
     # View registered domains
     logger.info("\nRegistered domains:")
-    domains = pulso.get_registered_domains()
-    for domain, policy in domains.items():
+    for domain, ttl, driver, retries, *_ in pulso.get_registered_domains_flat():
         logger.info(
-            f"  {domain}: TTL={policy.ttl_seconds}s, "
-            f"Driver={policy.driver}, Retries={policy.max_retries}"
+            f"  {domain}: TTL={ttl}s, "
+            f"Driver={driver}, Retries={retries}"
         )
 
     logger.info("Application completed")
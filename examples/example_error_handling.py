@@ -2,6 +2,7 @@
 
 import pulso
 import logging
+from time import time_ns
 
 # Setup logging to see error messages
 logging.basicConfig(level=logging.INFO)
@@ -20,7 +21,8 @@ pulso.register_domain(
     max_retries=3,
     retry_delay=1.0,
     fallback_on_error="return_cached",  # Return last cached data on error (default)
-    on_error=error_reporter  # Optional: callback on errors
+    on_error=error_reporter,  # Optional: callback on errors
+    prewarm=True  # Optional: connect in the background before the first fetch
 )
 
 url = "https://example.com"
@@ -80,11 +82,15 @@ error_log = []
 
 
 def track_errors(url, exception):
-    """Track all errors for monitoring."""
+    """Track all errors for monitoring.
+
+    Callbacks run inline on every failed attempt, so keep them cheap
+    (no imports or blocking I/O here).
+    """
     error_log.append({
         "url": url,
         "error": str(exception),
-        "timestamp": __import__("time").time()
+        "timestamp": time_ns()
     })
     print(f"Logged error #{len(error_log)}: {url}")
 
@@ -100,12 +106,12 @@ pulso.register_domain(
 
 # View all registered domains and their policies
 print("\n=== Registered Domains ===")
-domains = pulso.get_registered_domains()
-for domain, policy in domains.items():
+domains = pulso.get_registered_domains_flat()
+for domain, ttl, driver, retries, retry_delay, fallback, has_callback in domains:
     print(f"\n{domain}:")
-    print(f"  TTL: {policy.ttl_seconds}s")
-    print(f"  Driver: {policy.driver}")
-    print(f"  Max retries: {policy.max_retries}")
-    print(f"  Retry delay: {policy.retry_delay}s")
-    print(f"  Fallback: {policy.fallback_on_error}")
-    print(f"  Error callback: {'Yes' if policy.on_error else 'No'}")
+    print(f"  TTL: {ttl}s")
+    print(f"  Driver: {driver}")
+    print(f"  Max retries: {retries}")
+    print(f"  Retry delay: {retry_delay}s")
+    print(f"  Fallback: {fallback}")
+    print(f"  Error callback: {'Yes' if has_callback else 'No'}")
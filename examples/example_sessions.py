@@ -39,11 +39,8 @@ def fetch_for_tenant(tenant_id: str, urls: list) -> dict:
     # Set tenant-specific session
     pulso.set_session(f"tenant_{tenant_id}")
 
-    results = {}
-    for url in urls:
-        results[url] = pulso.fetch(url)
-
-    return results
+    # Fetch all tenant URLs concurrently
+    return pulso.fetch_many(urls)
 
 
 # Tenant A
@@ -2,19 +2,28 @@
 
 __version__ = "0.1.0"
 
-from .core import fetch, has_changed, snapshot, get_metadata
-from .domain import register_domain, get_registered_domains
+from .core import fetch, fetch_many, has_changed, peek, PeekResult, snapshot, get_metadata, get_size
+from .async_api import afetch, ahas_changed, asnapshot
+from .domain import register_domain, get_registered_domains, get_registered_domains_flat
 from .cache import cache
 from .fetcher import FetchError
 from .config import set_session, get_session, load_config
 
 __all__ = [
     "fetch",
+    "fetch_many",
     "has_changed",
+    "peek",
+    "PeekResult",
     "snapshot",
     "get_metadata",
+    "get_size",
+    "afetch",
+    "ahas_changed",
+    "asnapshot",
     "register_domain",
     "get_registered_domains",
+    "get_registered_domains_flat",
     "cache",
     "FetchError",
     "set_session",
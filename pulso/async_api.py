@@ -0,0 +1,64 @@
+"""Async equivalents of the core fetching functions."""
+
+from typing import Any, Callable, Optional, TypeVar
+from pathlib import Path
+import asyncio
+import contextvars
+import functools
+
+from . import core
+
+
+T = TypeVar("T")
+
+
+async def _run(func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking function in the default executor.
+
+    The caller's context is carried over, so session state set in the
+    calling task applies to the work done in the thread.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(None, functools.partial(ctx.run, func, *args))
+
+
+async def afetch(url: str, force: bool = False) -> Optional[str]:
+    """Async version of fetch().
+
+    Several calls can be awaited together with asyncio.gather() so their
+    network requests overlap.
+
+    Args:
+        url: URL to fetch
+        force: Force refetch even if cached and fresh
+
+    Returns:
+        HTML content, or None if fetch fails and fallback_on_error='return_none'
+    """
+    return await _run(core.fetch, url, force)
+
+
+async def ahas_changed(url: str) -> bool:
+    """Async version of has_changed().
+
+    Args:
+        url: URL to check
+
+    Returns:
+        True if content has changed or URL not cached
+    """
+    return await _run(core.has_changed, url)
+
+
+async def asnapshot(url: str, snapshot_dir: Optional[Path] = None) -> Optional[Path]:
+    """Async version of snapshot().
+
+    Args:
+        url: URL to snapshot
+        snapshot_dir: Optional directory for snapshots
+
+    Returns:
+        Path to snapshot file if successful, None if URL not cached
+    """
+    return await _run(core.snapshot, url, snapshot_dir)
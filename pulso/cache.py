@@ -4,16 +4,51 @@ import hashlib
 import json
 import os
 import platform
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, List, Set
 from urllib.parse import urlparse
 
+import blake3
+
 try:
     from .config import config
 except ImportError:
     config = None
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# Algorithm used for content hashes, recorded in metadata so entries
+# written with an older algorithm can be migrated on read
+HASH_ALGORITHM = "blake3"
+
+# Inputs above this size are hashed with BLAKE3's multithreaded tree mode
+_PARALLEL_HASH_THRESHOLD = 1024 * 1024
+
+# Blobs younger than this are never garbage collected, so a blob written
+# by another process just before its metadata is not swept away
+_BLOB_GC_GRACE_SECONDS = 60
+
+# Compression dictionaries are trained per domain from this many bodies,
+# each truncated to _DICT_SAMPLE_BYTES, into a dictionary of _DICT_SIZE bytes
+_DICT_TRAINING_SAMPLES = 100
+_DICT_SAMPLE_BYTES = 128 * 1024
+_DICT_SIZE = 64 * 1024
+
+# Upper bound on training samples held in memory across all domains; the
+# domain that least recently received a sample is dropped to stay under it
+_DICT_SAMPLES_MAX_BYTES = 16 * 1024 * 1024
+
+# Trained dictionaries kept in memory, by domain and by ID; the least
+# recently used are dropped and reloaded from dicts/ when needed again
+_DICT_CACHE_SIZE = 64
+
 
 class CacheEntry:
     """A single cache entry with metadata."""
@@ -25,7 +60,9 @@ class CacheEntry:
         content_hash: str,
         fetch_time: float,
         change_time: float,
-        change_count: int = 0
+        change_count: int = 0,
+        body_hash: Optional[str] = None,
+        content_length: Optional[int] = None
     ):
         self.url = url
         self.html = html
@@ -33,6 +70,8 @@ class CacheEntry:
         self.fetch_time = fetch_time
         self.change_time = change_time
         self.change_count = change_count
+        self.body_hash = body_hash
+        self.content_length = content_length
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -41,7 +80,10 @@ class CacheEntry:
             "content_hash": self.content_hash,
             "fetch_time": self.fetch_time,
             "change_time": self.change_time,
-            "change_count": self.change_count
+            "change_count": self.change_count,
+            "hash_algorithm": HASH_ALGORITHM,
+            "body_hash": self.body_hash,
+            "content_length": self.content_length
         }
 
     @classmethod
@@ -53,7 +95,9 @@ class CacheEntry:
             content_hash=data["content_hash"],
             fetch_time=data["fetch_time"],
             change_time=data["change_time"],
-            change_count=data.get("change_count", 0)
+            change_count=data.get("change_count", 0),
+            body_hash=data.get("body_hash"),
+            content_length=data.get("content_length")
         )
 
 
@@ -62,31 +106,115 @@ class CacheManager:
 
     def __init__(self, session_id: Optional[str] = None):
         self._session_id = session_id
-        self.cache_dir = self._get_cache_dir()
+        self.base_dir = self._get_base_dir()
+        # Cache directory per session ID, created on first use
+        self._session_dirs: Dict[str, Path] = {}
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-    def _get_cache_dir(self) -> Path:
-        """Get platform-specific cache directory with session support."""
+        # HTML bodies are content-addressed and shared by all sessions;
+        # per-session metadata points at them by body_hash
+        self.blob_dir = self.base_dir / "blobs"
+
+        # Blobs are zstd-compressed when enabled and zstandard is installed,
+        # with a dictionary per domain trained from its first cached bodies
+        self.dict_dir = self.base_dir / "dicts"
+        self._compress = zstandard is not None and (config.cache_compression if config else False)
+        self._dict_lock = threading.Lock()
+        self._dict_samples: "OrderedDict[str, List[bytes]]" = OrderedDict()
+        self._dict_sample_bytes = 0
+        self._dicts_by_domain: "OrderedDict[str, Optional[Any]]" = OrderedDict()
+        self._dicts_by_id: "OrderedDict[int, Any]" = OrderedDict()
+        # Dictionary IDs with no file in dicts/, so unreadable blobs do not
+        # rescan the directory on every read
+        self._missing_dict_ids: Set[int] = set()
+
+        # In-process LRU of recently read/written entries, so back-to-back
+        # fetch/has_changed/get_metadata calls touch storage only once.
+        # Maps (session_id, url) -> (expiry, entry).
+        self._memory: "OrderedDict[Tuple[str, str], Tuple[float, CacheEntry]]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+        self._memory_size = config.memory_cache_size if config else 1024
+        self._memory_ttl = config.memory_cache_ttl if config else 60.0
+
+    def _memory_key(self, url: str) -> Tuple[str, str]:
+        """Build the memory cache key for a URL in the current session."""
+        return (self._current_session_id(), url)
+
+    def _memory_get(self, url: str) -> Optional[CacheEntry]:
+        """Get an entry from the memory cache if present and not expired."""
+        key = self._memory_key(url)
+        with self._memory_lock:
+            item = self._memory.get(key)
+            if item is None:
+                return None
+
+            expiry, entry = item
+            if time.monotonic() >= expiry:
+                del self._memory[key]
+                return None
+
+            self._memory.move_to_end(key)
+            return entry
+
+    def _memory_put(self, url: str, entry: CacheEntry) -> None:
+        """Store an entry in the memory cache, evicting the least recently used."""
+        if self._memory_size <= 0 or self._memory_ttl <= 0:
+            return
+
+        key = self._memory_key(url)
+        with self._memory_lock:
+            self._memory[key] = (time.monotonic() + self._memory_ttl, entry)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self._memory_size:
+                self._memory.popitem(last=False)
+
+    def _memory_clear(self, url: Optional[str] = None) -> None:
+        """Drop one URL, or everything, from the memory cache."""
+        with self._memory_lock:
+            if url is None:
+                self._memory.clear()
+            else:
+                self._memory.pop(self._memory_key(url), None)
+
+    def _get_base_dir(self) -> Path:
+        """Get platform-specific base cache directory shared by all sessions."""
         # Check for custom cache directory from config
         if config and config.cache_dir:
-            base_dir = config.cache_dir
-        else:
-            # Use platform defaults
-            system = platform.system()
-            if system == "Windows":
-                base = Path(os.environ.get("LOCALAPPDATA", "~"))
-                base_dir = (base / "pulso").expanduser()
-            else:
-                base = Path.home() / ".cache"
-                base_dir = base / "pulso"
+            return config.cache_dir
+
+        # Use platform defaults
+        system = platform.system()
+        if system == "Windows":
+            base = Path(os.environ.get("LOCALAPPDATA", "~"))
+            return (base / "pulso").expanduser()
+
+        return Path.home() / ".cache" / "pulso"
 
+    def _current_session_id(self) -> str:
+        """Get the session ID cache operations currently apply to."""
         # Apply session if configured
-        if config and config.session_id != "default":
-            return base_dir / "sessions" / config.session_id
-        elif self._session_id:
-            return base_dir / "sessions" / self._session_id
+        session_id = config.session_id if config else "default"
+        if session_id == "default" and self._session_id:
+            return self._session_id
+        return session_id
+
+    @property
+    def cache_dir(self) -> Path:
+        """Cache directory for the current session."""
+        session_id = self._current_session_id()
+        cache_dir = self._session_dirs.get(session_id)
+        if cache_dir is None:
+            cache_dir = self._get_cache_dir(session_id)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            self._session_dirs[session_id] = cache_dir
+        return cache_dir
+
+    def _get_cache_dir(self, session_id: str) -> Path:
+        """Get platform-specific cache directory with session support."""
+        if session_id == "default":
+            return self.base_dir
 
-        return base_dir
+        return self.base_dir / "sessions" / session_id
 
     def _normalize_html(self, html: str) -> str:
         """Normalize HTML for hashing."""
@@ -105,9 +233,11 @@ class CacheManager:
         return normalized
 
     def _compute_hash(self, html: str) -> str:
-        """Compute hash of normalized HTML content."""
-        normalized = self._normalize_html(html)
-        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+        """Compute BLAKE3 hash of normalized HTML content."""
+        data = self._normalize_html(html).encode('utf-8')
+        if len(data) > _PARALLEL_HASH_THRESHOLD:
+            return blake3.blake3(data, max_threads=blake3.blake3.AUTO).hexdigest()
+        return blake3.blake3(data).hexdigest()
 
     def _url_to_path(self, url: str) -> Path:
         """Convert URL to cache file path."""
@@ -123,34 +253,339 @@ class CacheManager:
         return domain_dir / f"{url_hash}.json"
 
     def _html_path(self, url: str) -> Path:
-        """Get path for HTML content storage."""
+        """Get path for legacy per-URL HTML content storage."""
         cache_path = self._url_to_path(url)
         return cache_path.with_suffix('.html')
 
+    def _compute_body_hash(self, body: bytes) -> str:
+        """Compute BLAKE3 hash of the UTF-8 encoded HTML, used as its blob address."""
+        return blake3.blake3(body).hexdigest()
+
+    def _blob_path(self, body_hash: str) -> Path:
+        """Get path for uncompressed content-addressed HTML storage."""
+        return self.blob_dir / body_hash[:2] / f"{body_hash}.html"
+
+    def _compressed_blob_path(self, body_hash: str) -> Path:
+        """Get path for zstd-compressed content-addressed HTML storage."""
+        return self.blob_dir / body_hash[:2] / f"{body_hash}.zst"
+
+    def _put_blob(self, body_hash: str, body: bytes, domain: str) -> None:
+        """Store HTML under its hash unless a readable identical blob already exists."""
+        plain_path = self._blob_path(body_hash)
+        compressed_path = self._compressed_blob_path(body_hash)
+        compressed_readable = True
+        for existing_path in (plain_path, compressed_path):
+            try:
+                if existing_path == compressed_path and not self._can_decompress(existing_path):
+                    # Written by a process with zstandard or a dictionary
+                    # this one lacks; store a plain copy alongside it
+                    compressed_readable = False
+                    break
+                # Refresh the mtime so a concurrent sweep treats a reused
+                # (possibly orphaned) blob as new until our metadata lands
+                os.utime(existing_path)
+                return
+            except FileNotFoundError:
+                continue
+
+        if self._compress and compressed_readable:
+            blob_path = compressed_path
+            data = self._compress_body(body, domain)
+        else:
+            blob_path = plain_path
+            data = body
+
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a private temp file and rename, so concurrent writers of
+        # the same content never expose a partial blob
+        tmp_path = blob_path.with_name(f"{blob_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, blob_path)
+
+    def _get_blob(self, body_hash: str) -> str:
+        """Read HTML stored under its hash, preferring the plain blob."""
+        try:
+            with open(self._blob_path(body_hash), 'rb') as f:
+                return f.read().decode('utf-8')
+        except FileNotFoundError:
+            pass
+
+        with open(self._compressed_blob_path(body_hash), 'rb') as f:
+            return self._decompress_body(f.read()).decode('utf-8')
+
+    def _can_decompress(self, compressed_path: Path) -> bool:
+        """Check whether this process can decode a compressed blob."""
+        with open(compressed_path, 'rb') as f:
+            data = f.read()
+        try:
+            self._decompress_body(data)
+        except IOError:
+            return False
+        return True
+
+    def _compress_body(self, body: bytes, domain: str) -> bytes:
+        """Compress a body with its domain's dictionary, once one is trained."""
+        zstd_dict = self._domain_dict(domain, body)
+        if zstd_dict is None:
+            return zstandard.ZstdCompressor().compress(body)
+        return zstandard.ZstdCompressor(dict_data=zstd_dict).compress(body)
+
+    def _decompress_body(self, data: bytes) -> bytes:
+        """Decompress a blob, loading the dictionary it was compressed with."""
+        if zstandard is None:
+            raise IOError("Compressed cache blob found but zstandard is not installed")
+
+        dict_id = zstandard.get_frame_parameters(data).dict_id
+        if not dict_id:
+            return zstandard.ZstdDecompressor().decompress(data)
+
+        zstd_dict = self._dict_by_id(dict_id)
+        if zstd_dict is None:
+            raise IOError(f"Compression dictionary {dict_id} not found")
+
+        return zstandard.ZstdDecompressor(dict_data=zstd_dict).decompress(data)
+
+    def _domain_dict(self, domain: str, body: bytes) -> Optional[Any]:
+        """Get the domain's compression dictionary, training it when enough samples exist."""
+        with self._dict_lock:
+            if domain in self._dicts_by_domain:
+                self._dicts_by_domain.move_to_end(domain)
+                return self._dicts_by_domain[domain]
+
+            dict_paths = self._domain_dict_paths(domain)
+            if dict_paths:
+                # Another process may have trained one too; any works for
+                # writing, since readers look dictionaries up by ID
+                zstd_dict = zstandard.ZstdCompressionDict(dict_paths[0].read_bytes())
+                self._register_dict(domain, zstd_dict)
+                return zstd_dict
+
+            sample = body[:_DICT_SAMPLE_BYTES]
+            samples = self._dict_samples.setdefault(domain, [])
+            samples.append(sample)
+            self._dict_samples.move_to_end(domain)
+            self._dict_sample_bytes += len(sample)
+
+            while (self._dict_sample_bytes > _DICT_SAMPLES_MAX_BYTES
+                   and len(self._dict_samples) > 1):
+                _, dropped = self._dict_samples.popitem(last=False)
+                self._dict_sample_bytes -= sum(map(len, dropped))
+
+            if len(samples) < _DICT_TRAINING_SAMPLES:
+                return None
+
+            del self._dict_samples[domain]
+            self._dict_sample_bytes -= sum(map(len, samples))
+            try:
+                zstd_dict = zstandard.train_dictionary(_DICT_SIZE, samples)
+            except zstandard.ZstdError:
+                # Not enough distinct data to train on; stay dictionary-less
+                self._cache_domain_dict(domain, None)
+                return None
+
+            self._save_dict(domain, zstd_dict)
+            self._register_dict(domain, zstd_dict)
+            return zstd_dict
+
+    def _domain_dict_paths(self, domain: str) -> List[Path]:
+        """List persisted dictionaries for a domain, named {domain}.{dict_id}.zstd."""
+        if not self.dict_dir.exists():
+            return []
+
+        paths = []
+        for dict_path in self.dict_dir.glob(f"{domain}.*.zstd"):
+            name, _, dict_id = dict_path.name[:-len(".zstd")].rpartition(".")
+            if name == domain and dict_id.isdigit():
+                paths.append(dict_path)
+        return sorted(paths)
+
+    def _save_dict(self, domain: str, zstd_dict: Any) -> None:
+        """Persist a dictionary under its ID without ever replacing an existing one."""
+        dict_path = self.dict_dir / f"{domain}.{zstd_dict.dict_id()}.zstd"
+        if dict_path.exists():
+            return
+
+        self.dict_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = dict_path.with_name(f"{dict_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(zstd_dict.as_bytes())
+        os.replace(tmp_path, dict_path)
+
+    def _register_dict(self, domain: str, zstd_dict: Any) -> None:
+        """Index a dictionary by domain and by its zstd dictionary ID."""
+        self._cache_domain_dict(domain, zstd_dict)
+        self._cache_id_dict(zstd_dict.dict_id(), zstd_dict)
+
+    def _cache_domain_dict(self, domain: str, zstd_dict: Optional[Any]) -> None:
+        """Remember a domain's dictionary, evicting the least recently used."""
+        self._dicts_by_domain[domain] = zstd_dict
+        self._dicts_by_domain.move_to_end(domain)
+        while len(self._dicts_by_domain) > _DICT_CACHE_SIZE:
+            self._dicts_by_domain.popitem(last=False)
+
+    def _cache_id_dict(self, dict_id: int, zstd_dict: Any) -> None:
+        """Remember a dictionary by ID, evicting the least recently used."""
+        self._dicts_by_id[dict_id] = zstd_dict
+        self._dicts_by_id.move_to_end(dict_id)
+        while len(self._dicts_by_id) > _DICT_CACHE_SIZE:
+            self._dicts_by_id.popitem(last=False)
+
+    def _dict_by_id(self, dict_id: int) -> Optional[Any]:
+        """Get a dictionary by ID, loading it from dicts/ if another process trained it."""
+        with self._dict_lock:
+            zstd_dict = self._dicts_by_id.get(dict_id)
+            if zstd_dict is not None:
+                self._dicts_by_id.move_to_end(dict_id)
+                return zstd_dict
+
+            if dict_id in self._missing_dict_ids:
+                return None
+
+            # Dictionaries are named {domain}.{dict_id}.zstd, so only the
+            # matching file is read
+            dict_paths = sorted(self.dict_dir.glob(f"*.{dict_id}.zstd")) if self.dict_dir.exists() else []
+            if not dict_paths:
+                self._missing_dict_ids.add(dict_id)
+                return None
+
+            zstd_dict = zstandard.ZstdCompressionDict(dict_paths[0].read_bytes())
+            self._cache_id_dict(dict_id, zstd_dict)
+            return zstd_dict
+
+    def _collect_blobs(self) -> None:
+        """Delete blobs no longer referenced by any session's metadata."""
+        if not self.blob_dir.exists():
+            return
+
+        referenced = set()
+        for meta_path in self.base_dir.rglob("*.json"):
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    body_hash = json.load(f).get("body_hash")
+            except (json.JSONDecodeError, IOError, AttributeError):
+                continue
+            if body_hash:
+                referenced.add(body_hash)
+
+        cutoff = time.time() - _BLOB_GC_GRACE_SECONDS
+        for blob_path in self.blob_dir.glob("*/*"):
+            if blob_path.name.split(".", 1)[0] in referenced:
+                continue
+            try:
+                if blob_path.stat().st_mtime < cutoff:
+                    blob_path.unlink()
+            except FileNotFoundError:
+                pass
+
     def get(self, url: str) -> Optional[CacheEntry]:
         """Get cache entry for URL."""
+        entry = self._memory_get(url)
+        if entry is not None:
+            return entry
+
+        entry = self._read_entry(url)
+        if entry is not None:
+            self._memory_put(url, entry)
+        return entry
+
+    def _read_metadata(self, url: str) -> Optional[Dict[str, Any]]:
+        """Read only the metadata record for URL from disk."""
         cache_path = self._url_to_path(url)
-        html_path = self._html_path(url)
 
-        if not cache_path.exists() or not html_path.exists():
+        if not cache_path.exists():
             return None
 
         try:
             with open(cache_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                return json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return None
 
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html = f.read()
+    def get_size(self, url: str) -> Optional[int]:
+        """Get the size in bytes of the cached HTML without loading it."""
+        entry = self._memory_get(url)
+        if entry is not None and entry.content_length is not None:
+            return entry.content_length
 
-            return CacheEntry.from_dict(data, html)
-        except (json.JSONDecodeError, IOError):
+        data = self._read_metadata(url)
+        if not data:
             return None
 
+        if data.get("content_length") is not None:
+            return data["content_length"]
+
+        # Entry written before sizes were recorded
+        body_hash = data.get("body_hash")
+        try:
+            if body_hash and zstandard is not None and not self._blob_path(body_hash).exists():
+                compressed_path = self._compressed_blob_path(body_hash)
+                if compressed_path.exists():
+                    # The zstd frame header records the uncompressed size
+                    with open(compressed_path, 'rb') as f:
+                        size = zstandard.get_frame_parameters(f.read(18)).content_size
+                    return size if size != zstandard.CONTENTSIZE_UNKNOWN else None
+
+            path = self._blob_path(body_hash) if body_hash else self._html_path(url)
+            return path.stat().st_size
+        except FileNotFoundError:
+            return None
+
+    def _read_entry(self, url: str) -> Optional[CacheEntry]:
+        """Read cache entry for URL from disk."""
+        cache_path = self._url_to_path(url)
+
+        data = self._read_metadata(url)
+        if data is None:
+            return None
+
+        try:
+            body_hash = data.get("body_hash")
+            if body_hash:
+                html = self._get_blob(body_hash)
+            else:
+                # Entry written before content-addressed storage
+                with open(self._html_path(url), 'r', encoding='utf-8') as f:
+                    html = f.read()
+        except IOError:
+            return None
+
+        entry = CacheEntry.from_dict(data, html)
+
+        if data.get("hash_algorithm") != HASH_ALGORITHM:
+            # Rehash entries written with an older algorithm so the
+            # upgrade is not reported as a content change
+            entry.content_hash = self._compute_hash(html)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(entry.to_dict(), f, indent=2)
+
+        return entry
+
     def set(self, url: str, html: str, previous_entry: Optional[CacheEntry] = None) -> CacheEntry:
         """Store cache entry for URL."""
-        content_hash = self._compute_hash(html)
+        body = html.encode('utf-8')
+        body_hash = self._compute_body_hash(body)
         current_time = time.time()
 
+        if previous_entry and previous_entry.body_hash == body_hash:
+            # Byte-identical body: the blob is already stored and still
+            # referenced, so skip normalizing and only refresh fetch_time
+            entry = CacheEntry(
+                url=url,
+                html=html,
+                content_hash=previous_entry.content_hash,
+                fetch_time=current_time,
+                change_time=previous_entry.change_time,
+                change_count=previous_entry.change_count,
+                body_hash=body_hash,
+                content_length=len(body)
+            )
+            self._write_metadata(url, entry)
+            return entry
+
+        content_hash = self._compute_hash(html)
+
         # Determine if content changed
         if previous_entry and previous_entry.content_hash == content_hash:
             # No change, update fetch time only
@@ -160,7 +595,9 @@ class CacheManager:
                 content_hash=content_hash,
                 fetch_time=current_time,
                 change_time=previous_entry.change_time,
-                change_count=previous_entry.change_count
+                change_count=previous_entry.change_count,
+                body_hash=body_hash,
+                content_length=len(body)
             )
         else:
             # Content changed or new entry
@@ -171,20 +608,28 @@ class CacheManager:
                 content_hash=content_hash,
                 fetch_time=current_time,
                 change_time=current_time,
-                change_count=change_count
+                change_count=change_count,
+                body_hash=body_hash,
+                content_length=len(body)
             )
 
-        # Write metadata
+        # Write HTML content once per distinct body, then the metadata
+        # record pointing at it
+        parsed = urlparse(url)
+        self._put_blob(body_hash, body, parsed.netloc or parsed.path.split('/')[0])
+
+        self._write_metadata(url, entry)
+        self._html_path(url).unlink(missing_ok=True)
+
+        return entry
+
+    def _write_metadata(self, url: str, entry: CacheEntry) -> None:
+        """Write the metadata record for URL and refresh the memory cache."""
         cache_path = self._url_to_path(url)
         with open(cache_path, 'w', encoding='utf-8') as f:
             json.dump(entry.to_dict(), f, indent=2)
 
-        # Write HTML content
-        html_path = self._html_path(url)
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(html)
-
-        return entry
+        self._memory_put(url, entry)
 
     def is_fresh(self, url: str, ttl_seconds: int) -> bool:
         """Check if cached entry is still fresh."""
@@ -206,28 +651,48 @@ class CacheManager:
     def clear(self, domain: Optional[str] = None, url: Optional[str] = None) -> None:
         """Clear cache entries.
 
+        Clearing a domain or the whole session also deletes stored bodies
+        no session references anymore; clearing a single URL leaves its body
+        for the next such sweep, so it stays cheap.
+
         Args:
             domain: Clear all entries for a domain
             url: Clear specific URL entry
         """
+        self._memory_clear(url)
+
         if url:
             # Clear specific URL
             cache_path = self._url_to_path(url)
             html_path = self._html_path(url)
             cache_path.unlink(missing_ok=True)
             html_path.unlink(missing_ok=True)
-        elif domain:
+            return
+
+        if domain:
             # Clear domain directory
             domain_dir = self.cache_dir / domain
             if domain_dir.exists():
                 import shutil
                 shutil.rmtree(domain_dir)
         else:
-            # Clear entire cache
+            # Clear entire cache. The default session's directory is the
+            # base directory, which also holds the shared blob and
+            # dictionary stores and the other sessions' directories;
+            # those are kept, and the blobs swept below.
             if self.cache_dir.exists():
                 import shutil
-                shutil.rmtree(self.cache_dir)
-                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                shared = (self.blob_dir, self.dict_dir, self.base_dir / "sessions")
+                for child in self.cache_dir.iterdir():
+                    if child in shared:
+                        continue
+                    if child.is_dir():
+                        shutil.rmtree(child)
+                    else:
+                        child.unlink()
+
+        # Drop bodies no other session still references
+        self._collect_blobs()
 
     def snapshot(self, url: str, snapshot_dir: Optional[Path] = None) -> Optional[Path]:
         """Create a snapshot of the current HTML.
@@ -252,8 +717,21 @@ class CacheManager:
         url_hash = hashlib.md5(url.encode('utf-8')).hexdigest()[:8]
         snapshot_path = snapshot_dir / f"{url_hash}_{timestamp}.html"
 
-        with open(snapshot_path, 'w', encoding='utf-8') as f:
-            f.write(entry.html)
+        if entry.body_hash:
+            # A plain blob already holds the encoded body; copy it file to
+            # file (sendfile/copy_file_range where available) instead of
+            # re-encoding and writing it from Python
+            import shutil
+            try:
+                shutil.copyfile(self._blob_path(entry.body_hash), snapshot_path)
+                return snapshot_path
+            except FileNotFoundError:
+                pass
+
+        # Compressed-only and legacy entries are written from the decoded
+        # HTML; binary mode keeps the bytes identical to the copy above
+        with open(snapshot_path, 'wb') as f:
+            f.write(entry.html.encode('utf-8'))
 
         return snapshot_path
 
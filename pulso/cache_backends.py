@@ -2,7 +2,7 @@
 
 import json
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from abc import ABC, abstractmethod
 
 
@@ -119,6 +119,65 @@ class RedisBackend(CacheBackend):
         else:
             self.redis.set(redis_key, data)
 
+    def bulk_get(self, keys: List[str]) -> Dict[str, Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+        """Get metadata and HTML for many keys in as few round trips as possible.
+
+        Metadata and per-key HTML are read with one pipelined pair of MGETs;
+        entries whose HTML lives in the shared blob store are resolved with
+        one more MGET.
+
+        This is a backend-level primitive for callers using RedisBackend
+        directly; CacheManager stores to the filesystem and does not call it.
+
+        Returns:
+            Dictionary mapping each key to (metadata, html); either may be None
+        """
+        if not keys:
+            return {}
+
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.mget([self._make_key(key) for key in keys])
+        pipe.mget([self._make_key(f"{key}:html") for key in keys])
+        raw_values, raw_htmls = pipe.execute()
+
+        results: Dict[str, Tuple[Optional[Dict[str, Any]], Optional[str]]] = {}
+        missing_blobs: Dict[str, str] = {}
+        for key, raw_value, raw_html in zip(keys, raw_values, raw_htmls):
+            value = json.loads(raw_value.decode('utf-8')) if raw_value is not None else None
+            html = raw_html.decode('utf-8') if raw_html is not None else None
+            if value is not None and html is None and value.get("body_hash"):
+                missing_blobs[key] = value["body_hash"]
+            results[key] = (value, html)
+
+        if missing_blobs:
+            blob_keys = [self._blob_key(h) for h in missing_blobs.values()]
+            for key, raw_html in zip(missing_blobs, self.redis.mget(blob_keys)):
+                if raw_html is not None:
+                    results[key] = (results[key][0], raw_html.decode('utf-8'))
+
+        return results
+
+    def _blob_key(self, content_hash: str) -> str:
+        """Create Redis key for shared content-addressed HTML (not session-scoped)."""
+        return f"pulso:blob:{content_hash}"
+
+    def get_blob(self, content_hash: str) -> Optional[str]:
+        """Get HTML content stored under its hash."""
+        data = self.redis.get(self._blob_key(content_hash))
+
+        if data is None:
+            return None
+
+        return data.decode('utf-8')
+
+    def set_blob(self, content_hash: str, html: str) -> bool:
+        """Store HTML content under its hash if not already present.
+
+        Returns:
+            True if the blob was written, False if it already existed
+        """
+        return bool(self.redis.set(self._blob_key(content_hash), html.encode('utf-8'), nx=True))
+
 
 class MemoryBackend(CacheBackend):
     """In-memory cache backend for testing/development."""
@@ -126,6 +185,7 @@ class MemoryBackend(CacheBackend):
     def __init__(self, session_id: str = "default"):
         self.session_id = session_id
         self._cache: Dict[str, tuple[Dict[str, Any], Optional[float]]] = {}
+        self._blobs: Dict[str, str] = {}
 
     def _make_key(self, key: str) -> str:
         """Create session-scoped key."""
@@ -182,3 +242,18 @@ class MemoryBackend(CacheBackend):
 
         for key in keys_to_delete:
             del self._cache[key]
+
+    def get_blob(self, content_hash: str) -> Optional[str]:
+        """Get HTML content stored under its hash."""
+        return self._blobs.get(content_hash)
+
+    def set_blob(self, content_hash: str, html: str) -> bool:
+        """Store HTML content under its hash if not already present.
+
+        Returns:
+            True if the blob was written, False if it already existed
+        """
+        if content_hash in self._blobs:
+            return False
+        self._blobs[content_hash] = html
+        return True
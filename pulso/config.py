@@ -1,12 +1,36 @@
 """Configuration management for Pulso."""
 
 import os
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Optional, Literal, cast
+from typing import Optional, Literal, Dict, Tuple, cast
 
 
 CacheBackend = Literal["filesystem", "redis"]
 
+# Every environment variable PulsoConfig reads; the configuration only
+# needs rebuilding when one of these changes
+_PULSO_KEYS = (
+    "PULSO_CACHE_DIR",
+    "PULSO_SESSION_ID",
+    "PULSO_CACHE_BACKEND",
+    "PULSO_REDIS_URL",
+    "PULSO_LOG_LEVEL",
+    "PULSO_MEMORY_CACHE_SIZE",
+    "PULSO_MEMORY_CACHE_TTL",
+    "PULSO_CACHE_COMPRESSION",
+    "PULSO_DEFAULT_TTL",
+    "PULSO_DEFAULT_DRIVER",
+    "PULSO_DEFAULT_MAX_RETRIES",
+    "PULSO_DEFAULT_RETRY_DELAY",
+    "PULSO_DEFAULT_FALLBACK",
+    "PULSO_PLAYWRIGHT_HEADLESS",
+    "PULSO_PLAYWRIGHT_TIMEOUT",
+)
+
+# Parsed .env files keyed by path, with the (mtime_ns, size) they were parsed at
+_env_file_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, str]]] = {}
+
 
 def _get_env(key: str, default: Optional[str] = None) -> Optional[str]:
     """Read environment variable supporting legacy PULSO_* values."""
@@ -20,13 +44,51 @@ def _get_env_or_default(key: str, default: str) -> str:
     return default if value is None else value
 
 
+def _env_fingerprint() -> Tuple[Optional[str], ...]:
+    """Snapshot the values of all environment variables Pulso reads."""
+    environ = os.environ
+    return tuple(environ.get(key) for key in _PULSO_KEYS)
+
+
+def _parse_env_file(env_file: Path) -> Dict[str, str]:
+    """Parse KEY=VALUE lines from a .env file, reusing the result while unchanged."""
+    stat = env_file.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _env_file_cache.get(env_file)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    values: Dict[str, str] = {}
+    with open(env_file, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+
+            if '=' in line:
+                key, value = line.split('=', 1)
+                values[key.strip()] = value.strip()
+
+    _env_file_cache[env_file] = (signature, values)
+    return values
+
+
 class PulsoConfig:
     """Global configuration for the Pulso package."""
 
     def __init__(self):
+        # The current session lives in a context variable, so concurrent
+        # asyncio tasks and context-copying threads each see their own;
+        # code running outside any set_session() falls back to the
+        # process-wide value. Created once and kept across reloads.
+        if not hasattr(self, "_session_var"):
+            self._session_var: ContextVar[str] = ContextVar("pulso_session")
+
         # Load from environment variables
+        self._env_fingerprint = _env_fingerprint()
         self.cache_dir: Optional[Path] = self._get_cache_dir()
-        self.session_id: str = _get_env_or_default("PULSO_SESSION_ID", "default")
+        self.session_id = _get_env_or_default("PULSO_SESSION_ID", "default")
         self.cache_backend: CacheBackend = cast(
             CacheBackend,
             _get_env_or_default("PULSO_CACHE_BACKEND", "filesystem"),
@@ -34,6 +96,13 @@ class PulsoConfig:
         self.redis_url: Optional[str] = _get_env("PULSO_REDIS_URL")
         self.log_level: str = _get_env_or_default("PULSO_LOG_LEVEL", "INFO")
 
+        # In-process memory cache in front of the storage backend
+        self.memory_cache_size: int = int(_get_env_or_default("PULSO_MEMORY_CACHE_SIZE", "1024"))
+        self.memory_cache_ttl: float = float(_get_env_or_default("PULSO_MEMORY_CACHE_TTL", "60"))
+
+        # Compress cached bodies with zstd (opt-in, requires the zstandard package)
+        self.cache_compression: bool = _get_env_or_default("PULSO_CACHE_COMPRESSION", "false").lower() == "true"
+
         # Default domain policies
         self.default_ttl: str = _get_env_or_default("PULSO_DEFAULT_TTL", "1d")
         self.default_driver: str = _get_env_or_default("PULSO_DEFAULT_DRIVER", "requests")
@@ -52,6 +121,16 @@ class PulsoConfig:
             return Path(cache_dir_env).expanduser()
         return None
 
+    @property
+    def session_id(self) -> str:
+        """Session ID for the current context."""
+        return self._session_var.get(self._process_session_id)
+
+    @session_id.setter
+    def session_id(self, session_id: str) -> None:
+        self._session_var.set(session_id)
+        self._process_session_id = session_id
+
     def get_session_cache_dir(self, base_dir: Path) -> Path:
         """Get cache directory for current session."""
         if self.session_id == "default":
@@ -63,26 +142,18 @@ class PulsoConfig:
         self.session_id = session_id
 
     def load_from_env_file(self, env_file: Path) -> None:
-        """Load configuration from .env file."""
-        if not env_file.exists():
-            return
-
-        with open(env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
+        """Load configuration from .env file and the current environment.
 
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-
-                    # Set environment variable
-                    os.environ[key] = value
+        The file is only re-parsed when its mtime or size changes, and the
+        configuration is only rebuilt when a PULSO_* variable changed.
+        """
+        if env_file.exists():
+            # Set environment variables
+            os.environ.update(_parse_env_file(env_file))
 
         # Reload configuration
-        self.__init__()
+        if _env_fingerprint() != self._env_fingerprint:
+            self.__init__()
 
 
 # Global configuration instance
@@ -92,6 +163,10 @@ config = PulsoConfig()
 def set_session(session_id: str) -> None:
     """Set the current session ID for isolated caching.
 
+    The session applies to the current thread or asyncio task and to
+    work it starts through Pulso (fetch_many, afetch, ...), so concurrent
+    tasks can use different sessions without interfering.
+
     Args:
         session_id: Unique identifier for this session
 
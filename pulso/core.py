@@ -1,10 +1,12 @@
 """Core functions for stateful fetching."""
 
-from typing import Optional
+from typing import Optional, Dict, Iterable, NamedTuple
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
 import logging
 
-from .cache import cache
+from .cache import cache, CacheEntry
 from .domain import get_policy
 from .fetcher import fetch_raw, FetchError
 
@@ -64,17 +66,59 @@ def fetch(url: str, force: bool = False) -> Optional[str]:
             raise
 
 
-def has_changed(url: str) -> bool:
-    """Check if content has changed since last fetch.
+def fetch_many(urls: Iterable[str], concurrency: int = 16) -> Dict[str, Optional[str]]:
+    """Fetch several URLs concurrently with caching and TTL.
+
+    Each URL goes through the same path as fetch(), so cache hits are
+    served without a request and domain policies still apply. Network
+    fetches overlap instead of running one after another.
+
+    Args:
+        urls: URLs to fetch
+        concurrency: Maximum number of fetches in flight at once
+
+    Returns:
+        Dictionary mapping each URL to its HTML content (or None,
+        following the domain's fallback_on_error policy)
+
+    Raises:
+        FetchError: If a fetch fails and its domain policy is 'raise_error'
+    """
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return {}
+
+    workers = max(1, min(concurrency, len(urls)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Run each fetch in a copy of the caller's context so the current
+        # session applies inside the worker threads
+        futures = [
+            executor.submit(contextvars.copy_context().run, fetch, url)
+            for url in urls
+        ]
+        return {url: future.result() for url, future in zip(urls, futures)}
+
+
+class PeekResult(NamedTuple):
+    """Result of peek(): change status and the cached metadata after the check."""
+
+    changed: bool
+    metadata: Optional[dict]
+
+
+def peek(url: str) -> PeekResult:
+    """Check if content has changed and return its metadata in one call.
 
     This compares the content hash of the current cached version
-    with a fresh fetch.
+    with a fresh fetch, updates the cache if it changed, and returns the
+    resulting metadata, replacing a has_changed() + get_metadata() pair.
 
     Args:
         url: URL to check
 
     Returns:
-        True if content has changed or URL not cached
+        PeekResult with changed=True if content has changed or URL not
+        cached, and the metadata of the cached entry (None if not cached)
     """
     policy = get_policy(url)
 
@@ -82,21 +126,28 @@ def has_changed(url: str) -> bool:
     cached_entry = cache.get(url)
     if not cached_entry:
         # No cache, so technically it has "changed" (or is new)
-        return True
+        return PeekResult(True, None)
 
     # Fetch fresh content with error handling
     try:
         fresh_html = fetch_raw(url, policy=policy)
-        fresh_hash = cache._compute_hash(fresh_html)
 
-        # Compare hashes
+        # Fast path: byte-identical body means identical content, without
+        # parsing and normalizing the HTML
+        fresh_body_hash = cache._compute_body_hash(fresh_html.encode('utf-8'))
+        if cached_entry.body_hash and cached_entry.body_hash == fresh_body_hash:
+            return PeekResult(False, _entry_metadata(cached_entry))
+
+        # Compare normalized content hashes
+        fresh_hash = cache._compute_hash(fresh_html)
         changed = cached_entry.content_hash != fresh_hash
 
         # Update cache with fresh content if changed
         if changed:
-            cache.set(url, fresh_html, cached_entry)
+            entry = cache.set(url, fresh_html, cached_entry)
+            return PeekResult(True, _entry_metadata(entry))
 
-        return changed
+        return PeekResult(False, _entry_metadata(cached_entry))
 
     except FetchError as e:
         logger.error(f"Failed to check if {url} changed: {e}")
@@ -104,13 +155,28 @@ def has_changed(url: str) -> bool:
         # If we can't fetch, assume no change (return cached data is still valid)
         if policy.fallback_on_error == "return_cached":
             logger.info(f"Assuming no change for {url} due to fetch error")
-            return False
+            return PeekResult(False, _entry_metadata(cached_entry))
         elif policy.fallback_on_error == "return_none":
-            return False
+            return PeekResult(False, _entry_metadata(cached_entry))
         else:  # raise_error
             raise
 
 
+def has_changed(url: str) -> bool:
+    """Check if content has changed since last fetch.
+
+    This compares the content hash of the current cached version
+    with a fresh fetch.
+
+    Args:
+        url: URL to check
+
+    Returns:
+        True if content has changed or URL not cached
+    """
+    return peek(url).changed
+
+
 def snapshot(url: str, snapshot_dir: Optional[Path] = None) -> Optional[Path]:
     """Create a snapshot of the current cached HTML.
 
@@ -137,10 +203,31 @@ def get_metadata(url: str) -> Optional[dict]:
     if not entry:
         return None
 
+    return _entry_metadata(entry)
+
+
+def _entry_metadata(entry: CacheEntry) -> dict:
+    """Build the public metadata dictionary for a cache entry."""
     return {
         "url": entry.url,
         "content_hash": entry.content_hash,
         "fetch_time": entry.fetch_time,
         "change_time": entry.change_time,
-        "change_count": entry.change_count
+        "change_count": entry.change_count,
+        "content_length": entry.content_length
     }
+
+
+def get_size(url: str) -> Optional[int]:
+    """Get the size in bytes of a cached URL's HTML.
+
+    Reads only the metadata, so the body is never loaded into memory.
+    Use fetch() when the content itself is needed.
+
+    Args:
+        url: URL to get the size for
+
+    Returns:
+        Size in bytes of the UTF-8 encoded HTML, or None if not cached
+    """
+    return cache.get_size(url)
@@ -1,20 +1,55 @@
 """Domain registration and policy management."""
 
-from typing import Dict, Optional, Literal, Callable
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Literal, Callable, Tuple
 from urllib.parse import urlparse
-import re
 import logging
 
 
 DriverType = Literal["requests", "playwright"]
 FallbackBehavior = Literal["return_cached", "raise_error", "return_none"]
 
+# (domain, ttl_seconds, driver, max_retries, retry_delay, fallback_on_error, has_on_error)
+DomainSummary = Tuple[str, int, str, int, float, str, bool]
+
 logger = logging.getLogger(__name__)
 
+_TTL_MULTIPLIERS = {
+    's': 1,
+    'm': 60,
+    'h': 3600,
+    'd': 86400
+}
+
+
+@lru_cache(maxsize=256)
+def _parse_ttl(ttl: str) -> int:
+    """Parse TTL string like '1d', '12h', '30m' to seconds."""
+    unit = ttl[-1:].lower()
+    multiplier = _TTL_MULTIPLIERS.get(unit)
+    value = ttl[:-1]
+    if multiplier is None or not value.isdecimal():
+        raise ValueError(f"Invalid TTL format: {ttl}. Use format like '1d', '12h', '30m'")
+
+    return int(value) * multiplier
+
 
 class DomainPolicy:
     """Domain-specific policy for fetching and caching."""
 
+    # Fixed attribute layout: no per-instance __dict__ for registries
+    # holding thousands of policies
+    __slots__ = (
+        "domain",
+        "ttl_seconds",
+        "driver",
+        "max_retries",
+        "retry_delay",
+        "fallback_on_error",
+        "on_error",
+    )
+
     def __init__(
         self,
         domain: str,
@@ -35,21 +70,7 @@ class DomainPolicy:
 
     def _parse_ttl(self, ttl: str) -> int:
         """Parse TTL string like '1d', '12h', '30m' to seconds."""
-        match = re.match(r'^(\d+)([smhd])$', ttl.lower())
-        if not match:
-            raise ValueError(f"Invalid TTL format: {ttl}. Use format like '1d', '12h', '30m'")
-
-        value, unit = match.groups()
-        value = int(value)
-
-        multipliers = {
-            's': 1,
-            'm': 60,
-            'h': 3600,
-            'd': 86400
-        }
-
-        return value * multipliers[unit]
+        return _parse_ttl(ttl)
 
 
 class DomainRegistry:
@@ -57,6 +78,14 @@ class DomainRegistry:
 
     def __init__(self):
         self._domains: Dict[str, DomainPolicy] = {}
+        self._domains_view: Mapping[str, DomainPolicy] = MappingProxyType(self._domains)
+        # Wildcard policies ('*.example.com') in a trie keyed by reversed
+        # host labels: {'com': {'example': {'*': policy}}}
+        self._wildcards: Dict[str, Any] = {}
+        # Bumped on every registration; the flat summary is rebuilt lazily
+        # when it no longer matches
+        self._generation = 0
+        self._flat: Tuple[int, Tuple[DomainSummary, ...]] = (0, ())
         self._default_policy = DomainPolicy(
             "*",
             ttl="1d",
@@ -85,19 +114,86 @@ class DomainRegistry:
             on_error
         )
         self._domains[domain] = policy
+        self._generation += 1
+
+        if domain.startswith("*."):
+            node = self._wildcards
+            for label in reversed(domain[2:].lower().split(".")):
+                node = node.setdefault(label, {})
+            node["*"] = policy
 
     def get_policy(self, url: str) -> DomainPolicy:
-        """Get policy for a URL."""
+        """Get policy for a URL.
+
+        An exact domain registration wins; otherwise the most specific
+        matching wildcard ('*.example.com') applies.
+        """
         domain = self._extract_domain(url)
-        return self._domains.get(domain, self._default_policy)
+        policy = self._domains.get(domain)
+        if policy is not None:
+            return policy
+
+        if self._wildcards:
+            policy = self._match_wildcard(url)
+            if policy is not None:
+                return policy
+
+        return self._default_policy
 
-    def get_all_domains(self) -> Dict[str, DomainPolicy]:
+    def _match_wildcard(self, url: str) -> Optional[DomainPolicy]:
+        """Find the most specific wildcard policy covering the URL's host."""
+        host = urlparse(url).hostname
+        if not host:
+            return None
+
+        labels = host.split(".")
+        node = self._wildcards
+        match = None
+        # Stop before the leftmost label: '*.example.com' covers
+        # subdomains, not example.com itself
+        for label in reversed(labels[1:]):
+            node = node.get(label)
+            if node is None:
+                break
+            match = node.get("*", match)
+
+        return match
+
+    def get_all_domains(self) -> Mapping[str, DomainPolicy]:
         """Get all registered domains.
 
         Returns:
-            Dictionary mapping domain names to their policies
+            Read-only live view mapping domain names to their policies.
+            Iterating it while another thread registers a domain can raise
+            RuntimeError; use get_all_domains_flat() there instead.
+        """
+        return self._domains_view
+
+    def get_all_domains_flat(self) -> Tuple[DomainSummary, ...]:
+        """Get all registered domains as flat, immutable policy tuples.
+
+        The tuple is built once per registry change and shared by callers.
+
+        Returns:
+            Tuple of (domain, ttl_seconds, driver, max_retries, retry_delay,
+            fallback_on_error, has_on_error) tuples
         """
-        return self._domains.copy()
+        generation, flat = self._flat
+        if generation != self._generation:
+            flat = tuple(
+                (
+                    domain,
+                    policy.ttl_seconds,
+                    policy.driver,
+                    policy.max_retries,
+                    policy.retry_delay,
+                    policy.fallback_on_error,
+                    policy.on_error is not None,
+                )
+                for domain, policy in self._domains.items()
+            )
+            self._flat = (self._generation, flat)
+        return flat
 
     def _extract_domain(self, url: str) -> str:
         """Extract domain from URL."""
@@ -116,12 +212,14 @@ def register_domain(
     max_retries: int = 3,
     retry_delay: float = 1.0,
     fallback_on_error: FallbackBehavior = "return_cached",
-    on_error: Optional[Callable[[str, Exception], None]] = None
+    on_error: Optional[Callable[[str, Exception], None]] = None,
+    prewarm: bool = False
 ) -> None:
     """Register a domain with fetching and caching policy.
 
     Args:
-        domain: Domain name (e.g., 'example.com')
+        domain: Domain name (e.g., 'example.com'), or a wildcard covering
+            all subdomains (e.g., '*.example.com')
         ttl: Time-to-live for cache (e.g., '1d', '12h', '30m')
         driver: Fetch driver to use ('requests' or 'playwright')
         max_retries: Maximum number of retry attempts on failure (default: 3)
@@ -130,7 +228,12 @@ def register_domain(
             - 'return_cached': Return last cached data if available (default)
             - 'raise_error': Raise the exception
             - 'return_none': Return None on error
-        on_error: Optional callback function(url, exception) called on errors
+        on_error: Optional callback function(url, exception) called on errors.
+            It runs synchronously on every failed attempt, before the retry
+            delay, so it should be cheap (avoid imports or blocking I/O in it)
+        prewarm: Open a connection to the domain in the background now, so
+            the first fetch skips DNS and the TCP/TLS handshake
+            (requests driver only; default: False)
     """
     _registry.register(
         domain,
@@ -142,16 +245,38 @@ def register_domain(
         on_error
     )
 
+    if prewarm and driver == "requests" and not domain.startswith("*."):
+        from .fetcher import prewarm_connection
+        prewarm_connection(domain)
+
 
 def get_policy(url: str) -> DomainPolicy:
     """Get policy for a URL."""
     return _registry.get_policy(url)
 
 
-def get_registered_domains() -> Dict[str, DomainPolicy]:
+def get_registered_domains() -> Mapping[str, DomainPolicy]:
     """Get all currently registered domains.
 
     Returns:
-        Dictionary mapping domain names to their DomainPolicy objects
+        Read-only mapping of domain names to their DomainPolicy objects.
+        The mapping is a live view, so iterating or copying it while
+        another thread calls register_domain() can raise RuntimeError
+        (dictionary changed size during iteration). Code that lists
+        domains concurrently with registrations, such as an admin
+        endpoint, should use get_registered_domains_flat() instead.
     """
     return _registry.get_all_domains()
+
+
+def get_registered_domains_flat() -> Tuple[DomainSummary, ...]:
+    """Get all registered domains as flat policy tuples.
+
+    Cheaper than get_registered_domains() for code that lists policies
+    often; the result is cached until the next registration.
+
+    Returns:
+        Tuple of (domain, ttl_seconds, driver, max_retries, retry_delay,
+        fallback_on_error, has_on_error) tuples
+    """
+    return _registry.get_all_domains_flat()
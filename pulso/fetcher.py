@@ -1,24 +1,118 @@
 """Fetch web content using appropriate drivers."""
 
-from typing import Optional
+from typing import Optional, Dict, Set
+from urllib.parse import urlparse
+from http.cookiejar import CookiePolicy
+import atexit
+import threading
 import time
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 from .domain import get_policy, DriverType, DomainPolicy
 
 
 logger = logging.getLogger(__name__)
 
+# Persistent HTTP sessions keyed by host, so repeated fetches reuse
+# keep-alive connections instead of paying a new TCP/TLS handshake.
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+# Domains whose connection has already been pre-warmed
+_warmed: Set[str] = set()
+
+
+class _RejectCookies(CookiePolicy):
+    """Cookie policy that never stores or sends cookies.
+
+    Pooled sessions are shared by every Pulso session and tenant, so a
+    cookie set for one fetch must not leak into the next. Cookies within a
+    single request's redirect chain are still honoured by requests.
+    """
+
+    netscape = True
+    rfc2965 = False
+    hide_cookie2 = False
+
+    def set_ok(self, cookie, request):
+        return False
+
+    def return_ok(self, cookie, request):
+        return False
+
+    def domain_return_ok(self, domain, request):
+        return False
+
+    def path_return_ok(self, path, request):
+        return False
+
 
 class FetchError(Exception):
     """Error during fetch operation."""
     pass
 
 
+def _get_http_session(url: str) -> requests.Session:
+    """Get the shared requests session for the URL's host."""
+    host = urlparse(url).netloc
+    session = _sessions.get(host)
+    if session is not None:
+        return session
+
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            # Keep the connection pool but not the cookie jar
+            session.cookies.set_policy(_RejectCookies())
+            # Retries are handled by fetch_raw according to the domain policy
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[host] = session
+        return session
+
+
+def close_http_sessions() -> None:
+    """Close all pooled HTTP sessions and their connections."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+        _warmed.clear()
+
+
+def prewarm_connection(domain: str) -> None:
+    """Open a pooled connection to a domain in the background.
+
+    Resolves DNS and completes the TCP/TLS handshake with a HEAD request on
+    a daemon thread, so the first real fetch reuses a ready keep-alive
+    connection. Each domain is only warmed once; failures are ignored.
+    """
+    with _sessions_lock:
+        if domain in _warmed:
+            return
+        _warmed.add(domain)
+
+    url = f"https://{domain}/"
+
+    def warm() -> None:
+        try:
+            _get_http_session(url).head(url, timeout=2)
+        except requests.RequestException as e:
+            logger.debug(f"Connection pre-warm failed for {domain}: {e}")
+
+    threading.Thread(target=warm, name=f"pulso-prewarm-{domain}", daemon=True).start()
+
+
+atexit.register(close_http_sessions)
+
+
 def _fetch_with_requests(url: str) -> str:
     """Fetch using requests library."""
     try:
-        response = requests.get(url, timeout=30)
+        response = _get_http_session(url).get(url, timeout=30)
         response.raise_for_status()
         return response.text
     except requests.RequestException as e:
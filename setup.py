@@ -34,6 +34,7 @@ setup(
         "playwright>=1.40.0",
         "beautifulsoup4>=4.12.0",
         "lxml>=4.9.0",
+        "blake3>=0.3.0",
     ],
     extras_require={
         "dev": [
@@ -46,8 +47,12 @@ setup(
         "redis": [
             "redis>=5.0.0",
         ],
+        "zstd": [
+            "zstandard>=0.22.0",
+        ],
         "all": [
             "redis>=5.0.0",
+            "zstandard>=0.22.0",
         ],
     },
 )
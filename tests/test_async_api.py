@@ -0,0 +1,26 @@
+"""Tests for the async API."""
+
+import asyncio
+from unittest.mock import patch
+from pulso.async_api import afetch, ahas_changed
+
+
+def test_afetch_gather():
+    """Test that afetch results can be gathered concurrently."""
+    urls = ["https://a.test", "https://b.test"]
+
+    async def run():
+        return await asyncio.gather(*(afetch(url) for url in urls))
+
+    with patch("pulso.core.fetch", side_effect=lambda url, force: f"<html>{url}</html>"):
+        results = asyncio.run(run())
+
+    assert results == ["<html>https://a.test</html>", "<html>https://b.test</html>"]
+
+
+def test_ahas_changed_delegates():
+    """Test that ahas_changed runs the sync implementation."""
+    with patch("pulso.core.has_changed", return_value=True) as has_changed:
+        assert asyncio.run(ahas_changed("https://a.test")) is True
+
+    has_changed.assert_called_once_with("https://a.test")
@@ -0,0 +1,456 @@
+"""Tests for cache storage."""
+
+import pytest
+from unittest.mock import patch
+from pulso.cache import CacheManager
+from pulso.config import config
+
+
+HTML = "<html><body><p>Hello</p></body></html>"
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """Cache manager writing to a temporary directory."""
+    monkeypatch.setattr(config, "cache_dir", tmp_path)
+    return CacheManager()
+
+
+@pytest.fixture
+def plain_manager(tmp_path, monkeypatch):
+    """Cache manager storing uncompressed blobs in a temporary directory."""
+    monkeypatch.setattr(config, "cache_dir", tmp_path)
+    monkeypatch.setattr(config, "cache_compression", False)
+    return CacheManager()
+
+
+def test_set_and_get(manager):
+    """Test storing and reading back an entry."""
+    manager.set("https://example.com/a", HTML)
+
+    entry = manager.get("https://example.com/a")
+    assert entry.html == HTML
+    assert entry.change_count == 1
+
+
+def test_memory_cache_avoids_disk_reads(manager):
+    """Test that repeated reads are served from memory."""
+    manager.set("https://example.com/a", HTML)
+
+    with patch.object(manager, "_read_entry") as read_entry:
+        assert manager.get("https://example.com/a").html == HTML
+        assert manager.is_fresh("https://example.com/a", 60)
+        read_entry.assert_not_called()
+
+
+def test_memory_cache_expires(manager):
+    """Test that expired memory entries fall back to disk."""
+    manager.set("https://example.com/a", HTML)
+    manager._memory_ttl = 0.0
+    manager._memory_clear()
+
+    with patch.object(manager, "_read_entry", wraps=manager._read_entry) as read_entry:
+        assert manager.get("https://example.com/a").html == HTML
+        assert manager.get("https://example.com/a").html == HTML
+        assert read_entry.call_count == 2
+
+
+def test_memory_cache_evicts_lru(manager):
+    """Test that the memory cache is bounded."""
+    manager._memory_size = 2
+    for i in range(3):
+        manager.set(f"https://example.com/{i}", HTML)
+
+    assert len(manager._memory) == 2
+    assert manager._memory_get("https://example.com/0") is None
+
+
+def test_clear_url_drops_memory_entry(manager):
+    """Test that clearing a URL also clears it from memory."""
+    manager.set("https://example.com/a", HTML)
+    manager.clear(url="https://example.com/a")
+
+    assert manager.get("https://example.com/a") is None
+
+
+def test_content_hash_uses_blake3(manager):
+    """Test that content hashes are BLAKE3 digests of normalized HTML."""
+    import blake3
+
+    entry = manager.set("https://example.com/a", HTML)
+    assert entry.content_hash == blake3.blake3(b"Hello").hexdigest()
+
+
+def test_legacy_hash_migrated_on_read(manager):
+    """Test that entries hashed with an older algorithm are rehashed."""
+    import json
+
+    entry = manager.set("https://example.com/a", HTML)
+    cache_path = manager._url_to_path("https://example.com/a")
+    data = json.loads(cache_path.read_text())
+    data["content_hash"] = "legacy"
+    del data["hash_algorithm"]
+    cache_path.write_text(json.dumps(data))
+    manager._memory_clear()
+
+    migrated = manager.get("https://example.com/a")
+    assert migrated.content_hash == entry.content_hash
+    assert json.loads(cache_path.read_text())["hash_algorithm"] == "blake3"
+
+
+def test_identical_bodies_stored_once(tmp_path, monkeypatch):
+    """Test that sessions fetching the same body share one blob."""
+    monkeypatch.setattr(config, "cache_dir", tmp_path)
+    monkeypatch.setattr(config, "cache_compression", False)
+    user_a = CacheManager(session_id="user_a")
+    user_b = CacheManager(session_id="user_b")
+
+    entry_a = user_a.set("https://example.com/", HTML)
+    entry_b = user_b.set("https://example.com/", HTML)
+
+    assert entry_a.body_hash == entry_b.body_hash
+    assert len(list((tmp_path / "blobs").glob("*/*.html"))) == 1
+    assert user_b.get("https://example.com/").html == HTML
+
+
+def test_clear_collects_unreferenced_blobs(tmp_path, monkeypatch):
+    """Test that clearing a session only removes blobs nobody references."""
+    import os
+
+    monkeypatch.setattr(config, "cache_dir", tmp_path)
+    monkeypatch.setattr(config, "cache_compression", False)
+    user_a = CacheManager(session_id="user_a")
+    user_b = CacheManager(session_id="user_b")
+
+    shared = user_a.set("https://example.com/", HTML)
+    user_b.set("https://example.com/", HTML)
+    private = user_a.set("https://example.com/private", "<p>Only A</p>")
+    for entry in (shared, private):
+        os.utime(user_a._blob_path(entry.body_hash), (0, 0))
+
+    user_a.clear()
+
+    assert user_a._blob_path(shared.body_hash).exists()
+    assert not user_a._blob_path(private.body_hash).exists()
+    assert user_b.get("https://example.com/").html == HTML
+
+
+def test_clear_default_session_keeps_other_sessions(tmp_path, monkeypatch):
+    """Test that clearing the default session leaves other sessions intact."""
+    import os
+
+    monkeypatch.setattr(config, "cache_dir", tmp_path)
+    monkeypatch.setattr(config, "cache_compression", False)
+    default = CacheManager()
+    user_a = CacheManager(session_id="user_a")
+
+    default.set("https://example.com/", HTML)
+    entry = user_a.set("https://example.com/private", "<p>Only A</p>")
+    os.utime(user_a._blob_path(entry.body_hash), (0, 0))
+
+    default.clear()
+    user_a._memory_clear()
+
+    assert default.get("https://example.com/") is None
+    assert user_a.get("https://example.com/private").html == "<p>Only A</p>"
+
+
+def test_legacy_html_file_still_readable(manager):
+    """Test that entries stored before content addressing can be read."""
+    import json
+
+    url = "https://example.com/legacy"
+    entry = manager.set(url, HTML)
+    data = entry.to_dict()
+    del data["body_hash"]
+    manager._url_to_path(url).write_text(json.dumps(data))
+    manager._html_path(url).write_text(HTML)
+    manager._memory_clear()
+
+    assert manager.get(url).html == HTML
+
+
+def test_snapshot_matches_cached_html(manager, tmp_path):
+    """Test that snapshots contain the cached HTML."""
+    manager.set("https://example.com/a", HTML)
+
+    snapshot_path = manager.snapshot("https://example.com/a", tmp_path / "snaps")
+
+    assert snapshot_path.read_text(encoding="utf-8") == HTML
+
+
+def test_snapshot_falls_back_when_blob_missing(plain_manager, tmp_path):
+    """Test that a snapshot is still written if the blob disappeared."""
+    manager = plain_manager
+    entry = manager.set("https://example.com/a", HTML)
+    manager._blob_path(entry.body_hash).unlink()
+
+    snapshot_path = manager.snapshot("https://example.com/a", tmp_path / "snaps")
+
+    assert snapshot_path.read_text(encoding="utf-8") == HTML
+
+
+def test_snapshot_uncached_url(manager):
+    """Test that snapshotting an uncached URL returns None."""
+    assert manager.snapshot("https://example.com/missing") is None
+
+
+def test_get_size_reads_metadata_only(manager):
+    """Test that the cached size is available without loading the body."""
+    html = "<p>café</p>"
+    manager.set("https://example.com/a", html)
+    manager._memory_clear()
+
+    with patch.object(manager, "_get_blob") as get_blob:
+        assert manager.get_size("https://example.com/a") == len(html.encode("utf-8"))
+        get_blob.assert_not_called()
+
+    assert manager.get_size("https://example.com/missing") is None
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_get_size_legacy_entry(manager, compress):
+    """Test that entries without a recorded size fall back to the file size."""
+    import json
+
+    if compress:
+        pytest.importorskip("zstandard")
+    manager._compress = compress
+    url = "https://example.com/a"
+    entry = manager.set(url, HTML)
+    data = entry.to_dict()
+    del data["content_length"]
+    manager._url_to_path(url).write_text(json.dumps(data))
+    manager._memory_clear()
+
+    assert manager.get_size(url) == len(HTML)
+
+
+def test_compressed_blob_round_trip(manager):
+    """Test that compressed blobs read back as the original HTML."""
+    pytest.importorskip("zstandard")
+    manager._compress = True
+
+    entry = manager.set("https://example.com/a", HTML)
+    manager._memory_clear()
+
+    assert manager._compressed_blob_path(entry.body_hash).exists()
+    assert not manager._blob_path(entry.body_hash).exists()
+    assert manager.get("https://example.com/a").html == HTML
+
+
+def test_undecodable_compressed_blob_gets_plain_copy(manager, monkeypatch):
+    """Test that a reader without zstandard re-stores a .zst blob as plain HTML."""
+    import sys
+    pytest.importorskip("zstandard")
+    manager._compress = True
+    entry = manager.set("https://example.com/a", HTML)
+
+    monkeypatch.setattr(sys.modules["pulso.cache"], "zstandard", None)
+    reader = CacheManager()
+    assert reader.get("https://example.com/a") is None
+
+    reader.set("https://example.com/a", HTML)
+    reader._memory_clear()
+
+    assert reader._blob_path(entry.body_hash).exists()
+    assert reader.get("https://example.com/a").html == HTML
+
+
+def test_compression_dictionary_trained_per_domain(manager, tmp_path, monkeypatch):
+    """Test that a domain dictionary is trained, persisted and used."""
+    zstandard = pytest.importorskip("zstandard")
+    import sys
+
+    monkeypatch.setattr(sys.modules["pulso.cache"], "_DICT_TRAINING_SAMPLES", 40)
+    manager._compress = True
+    pages = [
+        f"<html><head><title>Page {i}</title></head><body><nav>Home About Blog</nav>"
+        f"<article><h1>Article number {i}</h1><p>{'lorem ipsum ' * (i % 7 + 3)}</p>"
+        f"</article><footer>Copyright Example Corp</footer></body></html>"
+        for i in range(60)
+    ]
+    for i, page in enumerate(pages):
+        manager.set(f"https://example.com/{i}", page)
+
+    assert len(manager._domain_dict_paths("example.com")) == 1
+
+    last = manager._url_to_path("https://example.com/59")
+    body_hash = __import__("json").loads(last.read_text())["body_hash"]
+    data = manager._compressed_blob_path(body_hash).read_bytes()
+    assert zstandard.get_frame_parameters(data).dict_id != 0
+
+    # A fresh manager loads the persisted dictionary to decompress
+    reader = CacheManager()
+    assert reader.get("https://example.com/59").html == pages[59]
+
+
+def test_snapshot_from_compressed_blob(manager, tmp_path):
+    """Test that snapshots of compressed blobs hold the same bytes as plain ones."""
+    pytest.importorskip("zstandard")
+    html = "<html>\n<body><p>Héllo</p></body>\n</html>\n"
+    manager._compress = True
+    manager.set("https://example.com/a", html)
+
+    snapshot_path = manager.snapshot("https://example.com/a", tmp_path / "snaps")
+
+    assert snapshot_path.read_bytes() == html.encode("utf-8")
+
+
+def test_cache_dir_follows_current_session(manager, tmp_path, monkeypatch):
+    """Test that switching sessions isolates cache entries."""
+    from contextvars import ContextVar
+
+    monkeypatch.setattr(config, "_session_var", ContextVar("test_session"))
+    monkeypatch.setattr(config, "_process_session_id", "default")
+
+    config.set_session("user_123")
+    manager.set("https://example.com/a", HTML)
+    assert manager.cache_dir == tmp_path / "sessions" / "user_123"
+
+    config.set_session("user_456")
+    assert manager.get("https://example.com/a") is None
+
+    config.set_session("user_123")
+    assert manager.get("https://example.com/a").html == HTML
+
+
+def test_set_identical_body_skips_hash_and_blob(manager):
+    """Test that re-storing an identical body only updates fetch_time."""
+    first = manager.set("https://example.com/a", HTML)
+
+    with patch.object(manager, "_compute_hash") as compute_hash, \
+            patch.object(manager, "_put_blob") as put_blob:
+        second = manager.set("https://example.com/a", HTML, first)
+        compute_hash.assert_not_called()
+        put_blob.assert_not_called()
+
+    assert second.content_hash == first.content_hash
+    assert second.change_count == first.change_count
+    assert second.change_time == first.change_time
+    assert second.fetch_time >= first.fetch_time
+
+    manager._memory_clear()
+    assert manager.get("https://example.com/a").fetch_time == second.fetch_time
+
+
+def test_set_changed_body_counts_change(manager):
+    """Test that a different body is stored and counted as a change."""
+    first = manager.set("https://example.com/a", HTML)
+    second = manager.set("https://example.com/a", "<p>Updated</p>", first)
+
+    assert second.change_count == 2
+    assert second.body_hash != first.body_hash
+    assert manager.get("https://example.com/a").html == "<p>Updated</p>"
+
+
+def test_clear_url_does_not_sweep_blobs(manager):
+    """Test that clearing one URL does not scan the whole cache."""
+    manager.set("https://example.com/a", HTML)
+
+    with patch.object(manager, "_collect_blobs") as collect_blobs:
+        manager.clear(url="https://example.com/a")
+        collect_blobs.assert_not_called()
+
+        manager.clear(domain="example.com")
+        collect_blobs.assert_called_once()
+
+
+def test_reused_blob_protected_from_sweep(plain_manager):
+    """Test that reusing an old orphaned blob refreshes its grace period."""
+    import os
+
+    manager = plain_manager
+    entry = manager.set("https://example.com/a", HTML)
+    blob_path = manager._blob_path(entry.body_hash)
+    manager.clear(url="https://example.com/a")
+    os.utime(blob_path, (0, 0))
+
+    manager._put_blob(entry.body_hash, HTML.encode("utf-8"), "example.com")
+    manager._collect_blobs()
+
+    assert blob_path.exists()
+
+
+def test_clear_keeps_compression_dictionaries(manager, monkeypatch):
+    """Test that clearing the default session keeps trained dictionaries."""
+    import sys
+
+    pytest.importorskip("zstandard")
+    monkeypatch.setattr(sys.modules["pulso.cache"], "_DICT_TRAINING_SAMPLES", 40)
+    manager._compress = True
+    for i in range(40):
+        manager.set(
+            f"https://example.com/{i}",
+            f"<html><body><nav>Home About</nav><h1>Post {i}</h1>"
+            f"<p>{'text ' * (i % 5 + 2)}</p><footer>Example</footer></body></html>"
+        )
+
+    manager.clear()
+    manager.set("https://example.com/new", HTML)
+
+    assert CacheManager().get("https://example.com/new").html == HTML
+
+
+def test_dictionaries_from_concurrent_trainers_coexist(manager, tmp_path):
+    """Test that a second trained dictionary never replaces the first."""
+    zstandard = pytest.importorskip("zstandard")
+    samples = [
+        f"<html><body><h1>Item {i}</h1><p>{'word ' * (i % 9 + 4)}</p></body></html>".encode()
+        for i in range(200)
+    ]
+    first = zstandard.train_dictionary(4096, samples[:100])
+    second = zstandard.train_dictionary(4096, samples[100:])
+
+    manager._save_dict("example.com", first)
+    manager._save_dict("example.com", second)
+
+    assert len(manager._domain_dict_paths("example.com")) == 2
+    data = zstandard.ZstdCompressor(dict_data=first).compress(samples[0])
+    assert CacheManager()._decompress_body(data) == samples[0]
+
+
+def test_dictionary_samples_bounded(manager, monkeypatch):
+    """Test that training samples held in memory stay under the byte cap."""
+    import sys
+
+    pytest.importorskip("zstandard")
+    monkeypatch.setattr(sys.modules["pulso.cache"], "_DICT_SAMPLES_MAX_BYTES", 1000)
+    manager._compress = True
+
+    for i in range(50):
+        manager.set(f"https://site{i}.test/", f"<p>{'x' * 100} {i}</p>")
+
+    assert manager._dict_sample_bytes <= 1000
+    assert manager._dict_sample_bytes == sum(
+        len(sample) for samples in manager._dict_samples.values() for sample in samples
+    )
+    assert "site49.test" in manager._dict_samples
+    assert "site0.test" not in manager._dict_samples
+
+
+def test_dictionary_cache_bounded(manager, monkeypatch):
+    """Test that loaded dictionaries are evicted and missing IDs not rescanned."""
+    import sys
+
+    zstandard = pytest.importorskip("zstandard")
+    monkeypatch.setattr(sys.modules["pulso.cache"], "_DICT_CACHE_SIZE", 2)
+    samples = [
+        f"<html><body><h1>Item {i}</h1><p>{'word ' * (i % 9 + 4)}</p></body></html>".encode()
+        for i in range(300)
+    ]
+    dicts = [zstandard.train_dictionary(4096, samples[i * 100:(i + 1) * 100]) for i in range(3)]
+    for i, zstd_dict in enumerate(dicts):
+        manager._save_dict(f"site{i}.test", zstd_dict)
+        data = zstandard.ZstdCompressor(dict_data=zstd_dict).compress(samples[i])
+        assert manager._decompress_body(data) == samples[i]
+
+    assert list(manager._dicts_by_id) == [dicts[1].dict_id(), dicts[2].dict_id()]
+
+    missing = zstandard.train_dictionary(4096, samples[::3])
+    data = zstandard.ZstdCompressor(dict_data=missing).compress(samples[0])
+    with pytest.raises(IOError):
+        manager._decompress_body(data)
+    with patch("pathlib.Path.glob") as glob, pytest.raises(IOError):
+        manager._decompress_body(data)
+    glob.assert_not_called()
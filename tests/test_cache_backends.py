@@ -0,0 +1,55 @@
+"""Tests for cache backends."""
+
+import json
+from unittest.mock import MagicMock
+from pulso.cache_backends import RedisBackend, MemoryBackend
+
+
+def make_redis_backend(session_id="default"):
+    """Create a RedisBackend with a mocked client."""
+    backend = RedisBackend.__new__(RedisBackend)
+    backend.redis = MagicMock()
+    backend.session_id = session_id
+    return backend
+
+
+def test_redis_bulk_get_single_round_trip():
+    """Test that bulk_get reads metadata and HTML in one pipeline."""
+    backend = make_redis_backend("user_1")
+    pipe = backend.redis.pipeline.return_value
+    pipe.execute.return_value = [
+        [json.dumps({"url": "a"}).encode(), None],
+        [b"<html>a</html>", None],
+    ]
+
+    results = backend.bulk_get(["a", "b"])
+
+    backend.redis.pipeline.assert_called_once_with(transaction=False)
+    pipe.mget.assert_any_call(["pulso:user_1:a", "pulso:user_1:b"])
+    pipe.mget.assert_any_call(["pulso:user_1:a:html", "pulso:user_1:b:html"])
+    backend.redis.mget.assert_not_called()
+    assert results == {"a": ({"url": "a"}, "<html>a</html>"), "b": (None, None)}
+
+
+def test_redis_bulk_get_resolves_blobs():
+    """Test that bulk_get fetches shared blobs for content-addressed entries."""
+    backend = make_redis_backend()
+    backend.redis.pipeline.return_value.execute.return_value = [
+        [json.dumps({"body_hash": "abc"}).encode()],
+        [None],
+    ]
+    backend.redis.mget.return_value = [b"<html>shared</html>"]
+
+    results = backend.bulk_get(["a"])
+
+    backend.redis.mget.assert_called_once_with(["pulso:blob:abc"])
+    assert results["a"][1] == "<html>shared</html>"
+
+
+def test_memory_backend_blobs_written_once():
+    """Test that identical blobs are only stored once."""
+    backend = MemoryBackend()
+
+    assert backend.set_blob("abc", "<html></html>") is True
+    assert backend.set_blob("abc", "<html></html>") is False
+    assert backend.get_blob("abc") == "<html></html>"
@@ -0,0 +1,81 @@
+"""Tests for configuration loading."""
+
+import pytest
+from unittest.mock import patch
+from pulso.config import PulsoConfig
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    """Environment without PULSO_* overrides."""
+    for key in ("PULSO_SESSION_ID", "PULSO_DEFAULT_TTL"):
+        monkeypatch.delenv(key, raising=False)
+    return monkeypatch
+
+
+def test_load_config_picks_up_env_changes(clean_env, tmp_path):
+    """Test that changed environment variables are applied."""
+    config = PulsoConfig()
+    clean_env.setenv("PULSO_SESSION_ID", "production_session")
+
+    config.load_from_env_file(tmp_path / "missing.env")
+
+    assert config.session_id == "production_session"
+
+
+def test_load_config_skips_rebuild_when_unchanged(clean_env, tmp_path):
+    """Test that an unchanged environment does not rebuild the config."""
+    config = PulsoConfig()
+    config.set_session("user_123")
+
+    config.load_from_env_file(tmp_path / "missing.env")
+
+    assert config.session_id == "user_123"
+
+
+def test_env_file_parsed_once_while_unchanged(clean_env, tmp_path):
+    """Test that an unchanged .env file is not re-read."""
+    env_file = tmp_path / ".env"
+    env_file.write_text("# comment\nPULSO_DEFAULT_TTL=12h\n")
+    clean_env.setenv("PULSO_DEFAULT_TTL", "1d")
+
+    config = PulsoConfig()
+    config.load_from_env_file(env_file)
+    assert config.default_ttl == "12h"
+
+    with patch("builtins.open") as mock_open:
+        config.load_from_env_file(env_file)
+        mock_open.assert_not_called()
+    assert config.default_ttl == "12h"
+
+
+def test_session_isolated_per_async_task(clean_env):
+    """Test that concurrent tasks keep their own session."""
+    import asyncio
+
+    config = PulsoConfig()
+
+    async def use_session(session_id):
+        config.set_session(session_id)
+        await asyncio.sleep(0)
+        return config.session_id
+
+    async def run():
+        return await asyncio.gather(use_session("tenant_a"), use_session("tenant_b"))
+
+    assert asyncio.run(run()) == ["tenant_a", "tenant_b"]
+
+
+def test_session_visible_to_plain_threads(clean_env):
+    """Test that threads without a copied context see the last set session."""
+    import threading
+
+    config = PulsoConfig()
+    config.set_session("user_123")
+    seen = []
+
+    thread = threading.Thread(target=lambda: seen.append(config.session_id))
+    thread.start()
+    thread.join()
+
+    assert seen == ["user_123"]
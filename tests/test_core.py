@@ -0,0 +1,117 @@
+"""Tests for core fetching functions."""
+
+from unittest.mock import patch
+from pulso.core import fetch_many
+
+
+def test_fetch_many_returns_results_in_order():
+    """Test that fetch_many maps every URL to its fetched content."""
+    urls = ["https://a.test/1", "https://b.test/2", "https://c.test/3"]
+
+    with patch("pulso.core.fetch", side_effect=lambda url: f"<html>{url}</html>"):
+        results = fetch_many(urls, concurrency=2)
+
+    assert list(results.keys()) == urls
+    assert results["https://b.test/2"] == "<html>https://b.test/2</html>"
+
+
+def test_fetch_many_deduplicates_urls():
+    """Test that duplicate URLs are fetched only once."""
+    calls = []
+
+    def fake_fetch(url):
+        calls.append(url)
+        return "<html></html>"
+
+    with patch("pulso.core.fetch", side_effect=fake_fetch):
+        results = fetch_many(["https://a.test", "https://a.test"])
+
+    assert calls == ["https://a.test"]
+    assert list(results) == ["https://a.test"]
+
+
+def test_fetch_many_empty():
+    """Test that an empty URL list returns an empty result."""
+    assert fetch_many([]) == {}
+
+
+def test_has_changed_skips_normalization_for_identical_body():
+    """Test that an identical body is reported unchanged without rehashing."""
+    from pulso.cache import CacheEntry
+    from pulso.core import has_changed
+
+    html = "<html><body>Same</body></html>"
+    entry = CacheEntry("https://a.test", html, "hash", 0.0, 0.0, 1, body_hash="raw")
+
+    with patch("pulso.core.cache") as cache, patch("pulso.core.fetch_raw", return_value=html):
+        cache.get.return_value = entry
+        cache._compute_body_hash.return_value = "raw"
+
+        assert has_changed("https://a.test") is False
+        cache._compute_hash.assert_not_called()
+        cache.set.assert_not_called()
+
+
+def test_has_changed_detects_new_content():
+    """Test that a different body is compared by normalized hash."""
+    from pulso.cache import CacheEntry
+    from pulso.core import has_changed
+
+    entry = CacheEntry("https://a.test", "<p>Old</p>", "old", 0.0, 0.0, 1, body_hash="raw-old")
+
+    with patch("pulso.core.cache") as cache, patch("pulso.core.fetch_raw", return_value="<p>New</p>"):
+        cache.get.return_value = entry
+        cache._compute_body_hash.return_value = "raw-new"
+        cache._compute_hash.return_value = "new"
+
+        assert has_changed("https://a.test") is True
+        cache.set.assert_called_once_with("https://a.test", "<p>New</p>", entry)
+
+
+def test_peek_returns_metadata_with_change_status():
+    """Test that peek returns the updated metadata when content changed."""
+    from pulso.cache import CacheEntry
+    from pulso.core import peek
+
+    old = CacheEntry("https://a.test", "<p>Old</p>", "old", 0.0, 0.0, 1, body_hash="raw-old")
+    new = CacheEntry("https://a.test", "<p>New</p>", "new", 5.0, 5.0, 2, body_hash="raw-new")
+
+    with patch("pulso.core.cache") as cache, patch("pulso.core.fetch_raw", return_value="<p>New</p>"):
+        cache.get.return_value = old
+        cache._compute_body_hash.return_value = "raw-new"
+        cache._compute_hash.return_value = "new"
+        cache.set.return_value = new
+
+        result = peek("https://a.test")
+
+    assert result.changed is True
+    assert result.metadata["content_hash"] == "new"
+    assert result.metadata["change_count"] == 2
+
+
+def test_peek_uncached_url():
+    """Test that peek reports uncached URLs as changed without metadata."""
+    from pulso.core import peek
+
+    with patch("pulso.core.cache") as cache:
+        cache.get.return_value = None
+        assert peek("https://a.test") == (True, None)
+
+
+def test_fetch_many_runs_in_callers_session():
+    """Test that worker threads see the caller's session."""
+    from contextvars import ContextVar
+    from pulso.config import config
+
+    seen = []
+
+    def fake_fetch(url):
+        seen.append(config.session_id)
+        return "<html></html>"
+
+    with patch.object(config, "_session_var", ContextVar("test_session")):
+        config._session_var.set("tenant_a")
+        with patch("pulso.core.fetch", side_effect=fake_fetch):
+            fetch_many(["https://a.test/1", "https://a.test/2"])
+
+    assert seen == ["tenant_a", "tenant_a"]
@@ -43,3 +43,73 @@ def test_default_policy():
 
     assert policy.domain == "*"
     assert policy.driver == "requests"
+
+
+def test_registered_domains_view_is_read_only():
+    """Test that the registered domains mapping cannot be mutated."""
+    registry = DomainRegistry()
+    registry.register("example.com", ttl="1h")
+
+    domains = registry.get_all_domains()
+    assert domains["example.com"].ttl_seconds == 3600
+
+    with pytest.raises(TypeError):
+        domains["other.com"] = domains["example.com"]
+
+    registry.register("other.com")
+    assert "other.com" in domains
+
+
+def test_policy_has_no_instance_dict():
+    """Test that policies use a fixed slot layout."""
+    policy = DomainPolicy("example.com")
+    assert not hasattr(policy, "__dict__")
+
+
+@pytest.mark.parametrize("ttl", ["", "d", "1x", "-1d", "1.5h", " 1d", "1dd"])
+def test_invalid_ttl_formats(ttl):
+    """Test that malformed TTL strings are rejected."""
+    with pytest.raises(ValueError):
+        DomainPolicy("example.com", ttl=ttl)
+
+
+def test_ttl_parsing_case_insensitive():
+    """Test that TTL units are case-insensitive."""
+    assert DomainPolicy("example.com", ttl="2D").ttl_seconds == 172800
+
+
+def test_wildcard_domain_policy():
+    """Test that wildcard registrations cover subdomains."""
+    registry = DomainRegistry()
+    registry.register("*.example.com", ttl="1h")
+    registry.register("*.api.example.com", ttl="5m")
+    registry.register("static.example.com", ttl="1d")
+
+    assert registry.get_policy("https://www.example.com/").ttl_seconds == 3600
+    assert registry.get_policy("https://v1.api.example.com/x").ttl_seconds == 300
+    assert registry.get_policy("https://static.example.com/").ttl_seconds == 86400
+    assert registry.get_policy("https://WWW.Example.com:8080/").ttl_seconds == 3600
+
+
+def test_wildcard_does_not_cover_apex():
+    """Test that '*.example.com' does not match example.com itself."""
+    registry = DomainRegistry()
+    registry.register("*.example.com", ttl="1h")
+
+    assert registry.get_policy("https://example.com/").domain == "*"
+    assert registry.get_policy("https://notexample.com/").domain == "*"
+
+
+def test_registered_domains_flat():
+    """Test flat policy tuples and their rebuild on registration."""
+    registry = DomainRegistry()
+    registry.register("example.com", ttl="1h", max_retries=2, on_error=print)
+
+    flat = registry.get_all_domains_flat()
+    assert flat == (("example.com", 3600, "requests", 2, 1.0, "return_cached", True),)
+    assert registry.get_all_domains_flat() is flat
+
+    registry.register("news.site", driver="playwright")
+    flat = registry.get_all_domains_flat()
+    assert [entry[0] for entry in flat] == ["example.com", "news.site"]
+    assert flat[1][6] is False
@@ -0,0 +1,93 @@
+"""Tests for fetch drivers."""
+
+from unittest.mock import patch, MagicMock
+from pulso import fetcher
+
+
+def test_http_session_reused_per_host():
+    """Test that fetches to the same host share one session."""
+    fetcher.close_http_sessions()
+
+    first = fetcher._get_http_session("https://pool-test.com/a")
+    second = fetcher._get_http_session("https://pool-test.com/b")
+    other = fetcher._get_http_session("https://other-pool-test.com/")
+
+    assert first is second
+    assert first is not other
+
+    fetcher.close_http_sessions()
+    assert fetcher._sessions == {}
+
+
+def test_fetch_with_requests_uses_pooled_session():
+    """Test that the requests driver goes through the pooled session."""
+    response = MagicMock(text="<html>ok</html>")
+    session = MagicMock()
+    session.get.return_value = response
+
+    with patch("pulso.fetcher._get_http_session", return_value=session):
+        html = fetcher._fetch_with_requests("https://pool-test.com/")
+
+    assert html == "<html>ok</html>"
+    session.get.assert_called_once_with("https://pool-test.com/", timeout=30)
+
+
+def test_prewarm_connection_runs_once_per_domain():
+    """Test that a domain is only pre-warmed once."""
+    fetcher.close_http_sessions()
+
+    with patch("pulso.fetcher.threading.Thread") as thread:
+        fetcher.prewarm_connection("warm-test.com")
+        fetcher.prewarm_connection("warm-test.com")
+
+    thread.assert_called_once()
+    assert thread.call_args.kwargs["daemon"] is True
+    fetcher.close_http_sessions()
+
+
+def test_register_domain_prewarm():
+    """Test that register_domain only pre-warms when asked to."""
+    from pulso.domain import register_domain
+
+    with patch("pulso.fetcher.prewarm_connection") as prewarm:
+        register_domain("no-warm-test.com")
+        register_domain("warm-test.com", prewarm=True)
+        register_domain("warm-browser-test.com", driver="playwright", prewarm=True)
+
+    prewarm.assert_called_once_with("warm-test.com")
+
+
+def test_pooled_session_does_not_persist_cookies():
+    """Test that a response cookie is not sent on the next fetch."""
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            received.append(self.headers.get("Cookie"))
+            self.send_response(200)
+            self.send_header("Set-Cookie", "variant=a; Path=/")
+            self.send_header("Content-Type", "text/html")
+            self.end_headers()
+            self.wfile.write(b"<html>ok</html>")
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_port}/"
+
+    try:
+        fetcher.close_http_sessions()
+        fetcher._fetch_with_requests(url)
+        fetcher._fetch_with_requests(url)
+    finally:
+        server.shutdown()
+        server.server_close()
+        fetcher.close_http_sessions()
+
+    assert received == [None, None]